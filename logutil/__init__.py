@@ -1,5 +1,9 @@
+import collections
+import errno
+import functools
 import logging
 import os
+import re
 import threading
 import time
 from logging.handlers import MemoryHandler
@@ -9,16 +13,99 @@ __version__ = '1.0.0'
 
 
 _lock = threading.Lock()
+DEFAULT_FORMAT = "[%(levelname)s][%(asctime)s] - %(message)s"
+_formatters = {}  # format string -> formatter shared by the handlers created by make_handler()
 LoggerClass = logging.getLoggerClass()
+_logger_handle = LoggerClass.handle  # bound once, `TimedRotatingLogger.handle` calls it for every record
+
+# level names, in upper and lower case, mapped to their numeric values
+_LEVEL_MAP = dict((name, getattr(logging, name)) for name in ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+_LEVEL_MAP.update([(name.lower(), levelno) for name, levelno in _LEVEL_MAP.items()])
+
+# clock used for flush intervals; a coarse monotonic clock is plenty for second-scale intervals
+if hasattr(time, 'CLOCK_MONOTONIC_COARSE'):
+    _now = functools.partial(time.clock_gettime, time.CLOCK_MONOTONIC_COARSE)
+else:
+    _now = getattr(time, 'monotonic', time.time)
+
+# index of the `time.struct_time` field (0: year ... 5: second) each strftime directive changes with;
+# directives not listed here are assumed to change every second
+_SUFFIX_DIRECTIVE_FIELDS = {
+    '%': -1,
+    'Y': 0, 'y': 0, 'C': 0,
+    'm': 1, 'b': 1, 'B': 1, 'h': 1,
+    'd': 2, 'e': 2, 'j': 2, 'a': 2, 'A': 2, 'u': 2, 'w': 2, 'U': 2, 'W': 2, 'V': 2, 'G': 2, 'g': 2,
+    'H': 3, 'I': 3, 'k': 3, 'l': 3, 'p': 3,
+    'M': 4,
+}
+_SUFFIX_DIRECTIVE_RE = re.compile(r'%(.)')
+
+# scatter/gather write of a batch, POSIX only; without it the batch is joined and written by `os.write`
+_writev = getattr(os, 'writev', None)
+try:
+    _IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
+
+
+# equivalents of time.strftime(suffixFmt, t) for common suffix formats, they skip parsing the format string
+_SUFFIX_FORMATTERS = {
+    '%Y-%m-%d': lambda t: '%04d-%02d-%02d' % (t[0], t[1], t[2]),
+    '%Y%m%d': lambda t: '%04d%02d%02d' % (t[0], t[1], t[2]),
+    '%Y-%m-%d-%H': lambda t: '%04d-%02d-%02d-%02d' % (t[0], t[1], t[2], t[3]),
+    '%Y-%m': lambda t: '%04d-%02d' % (t[0], t[1]),
+    '%H': lambda t: '%02d' % t[3],
+    '%M': lambda t: '%02d' % t[4],
+    '%S': lambda t: '%02d' % t[5],
+}
+
+
+def _suffix_formatter(suffixFmt):
+    """Return a callable which formats a `time.struct_time` the same way as `time.strftime(suffixFmt, t)`."""
+    return _SUFFIX_FORMATTERS.get(suffixFmt) or functools.partial(time.strftime, suffixFmt)
+
+
+def _suffix_field(suffixFmt):
+    """Return the index of the finest `time.struct_time` field the strftime format `suffixFmt` depends on."""
+    fields = [_SUFFIX_DIRECTIVE_FIELDS.get(d, 5) for d in _SUFFIX_DIRECTIVE_RE.findall(suffixFmt)]
+    return max(fields + [0])
+
+
+def _next_rotation(now, field):
+    """Return the epoch time at which the local time field `field` (see `_suffix_field`) next changes after `now`."""
+    # minutes and seconds change on epoch boundaries; `mktime` would put the next one an hour late when it
+    # falls in the repeated hour of a DST change
+    if field == 5:
+        return int(now) + 1
+    if field == 4:
+        return now - now % 60 + 60
+    t = list(time.localtime(now)[:field + 1]) + [1, 1, 0, 0, 0][field:]
+    t[field] += 1
+    return time.mktime(tuple(t) + (0, 0, -1))
+
+
+def _level_no(level):
+    """Return the numeric value of `level`, which is either a level name or already a number."""
+    if isinstance(level, int):
+        return level
+    return _LEVEL_MAP.get(level) or getattr(logging, level.upper())
+
+
+def _get_formatter(format):
+    """Return the `FastFormatter` for the format string `format`, it's shared by all handlers using the format."""
+    formatter = _formatters.get(format)
+    if formatter is None:
+        formatter = _formatters.setdefault(format, FastFormatter(format))
+    return formatter
 
 
-def make_handler(filename=None, format="[%(levelname)s][%(asctime)s] - %(message)s", capacity=1, flushInterval=120,
+def make_handler(filename=None, format=DEFAULT_FORMAT, capacity=1, flushInterval=120,
                  flushLevel=logging.ERROR):
-    """Factory function that return a new instance of `logging.FileHandler`  or  `logging.StreamHandler` or `_MemoryHandler`(with buffer)
+    """Factory function that return a new instance of `_RawFDHandler`  or  `logging.StreamHandler` or `_MemoryHandler`(with buffer)
     according to the argument `capacity` and `filename`.
 
     :param filename: new an instance of `logging.StreamHandler` using `sys.stdout` as the underlying stream if None or it's omitted,
-           otherwise new an instance of `logging.FileHandler`.
+           otherwise new an instance of `_RawFDHandler`.
     :param format: Format string for handlers.
     :param capacity: It will be passed to create a `_MemoryHandler` if its value greater then 1.
     :param flushInterval: the argument of the `_MemoryHandler`.
@@ -29,14 +116,16 @@ def make_handler(filename=None, format="[%(levelname)s][%(asctime)s] - %(message
         handler = logging.StreamHandler(stream=sys.stdout)
     else:
         filename = os.path.abspath(filename)
-        with _lock:
-            if not os.path.exists(os.path.dirname(filename) or './'):
-                os.makedirs(os.path.dirname(filename), )
-        handler = logging.FileHandler(filename)
+        dirname = os.path.dirname(filename)
+        try:
+            os.makedirs(dirname)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+        handler = _RawFDHandler(filename)
         
     # configure the core handler
-    formatter = logging.Formatter(format)
-    handler.setFormatter(formatter)
+    handler.setFormatter(_get_formatter(format))
     
     # create a wrapper handler that with buffering
     if capacity > 1:
@@ -108,22 +197,39 @@ class TimedRotatingLogger(SimpleLogger):
         """
         # assert handlerParams.get('filename', None), 'filename must be specified when initialize %s' % self.__class__
         self._suffixFmt = suffixFmt
-        self._suffix = time.strftime(self._suffixFmt)
+        now = time.time()
+        self._suffixFormatter = _suffix_formatter(suffixFmt)
+        self._suffix = self._suffixFormatter(time.localtime(now))
+        self._suffixField = _suffix_field(suffixFmt)
+        self._rotateAt = _next_rotation(now, self._suffixField)
         self._baseFilename = handlerParams.get('filename', None)
         self._re_lock = threading.RLock()
         SimpleLogger.__init__(self, name, level, **handlerParams)
 
     def handle(self, record):
         """overwrite"""
-        if self._suffix != time.strftime(self._suffixFmt):
-            with self._re_lock:
-                if self._suffix != time.strftime(self._suffixFmt):
-                    self._suffix = time.strftime(self._suffixFmt)
-                    self._rotate_handler()
-        LoggerClass.handle(self, record)
+        # the suffix can not change before `_rotateAt`, so the common path is a single float compare, lock free
+        if time.time() >= self._rotateAt:
+            self._rollover()
+        _logger_handle(self, record)
+
+    def _rollover(self):
+        """Rotates the handler if the suffix has changed. `_rotateAt` is assigned last, so until the new handler
+        is attached the other threads keep calling this method and wait on the lock. A thread that passed the
+        check in `handle` just before may still log to the old handler while it's closed, the check isn't atomic
+        with the handler iteration; `_RawFDHandler` reopens its file for such a write."""
+        with self._re_lock:
+            now = time.time()
+            if now < self._rotateAt:
+                return
+            suffix = self._suffixFormatter(time.localtime(now))
+            if self._suffix != suffix:
+                self._suffix = suffix
+                self._rotate_handler()
+            self._rotateAt = _next_rotation(now, self._suffixField)
 
     def _rotate_handler(self):
-        """Removes the all handlers from this logger, and then rotate filename (new a `logging.FileHandler`
+        """Removes the all handlers from this logger, and then rotate filename (new a file handler
         which be attached to this logger)"""
         with self._re_lock:
             self._del_handlers()
@@ -138,7 +244,7 @@ class TimedRotatingLogger(SimpleLogger):
 class TimedRotatingMemoryLogger(TimedRotatingLogger):
     """This class inherits ``logutil.TimedRotatingLogger`` and the argument `handlerParams` will be 
     passed to super class as additional keyword arguments. This logger buffers messages, and clients working threads 
-    just need to push message to memory, a new thread named 'flusher' asynchronously flush buffer once 
+    just need to push message to memory, a background thread named 'flusher' asynchronously flush buffer once 
     some condition be satisfied.
 
     Note: this logger just maintains one handler, others clients added will be popped out when method
@@ -155,7 +261,7 @@ class TimedRotatingMemoryLogger(TimedRotatingLogger):
                full_filename = filename + '.' + time.strftime(suffixFmt).
                Default value: "%Y-%m-%d", it means that files will be rotated every day at midnight.
         :param capacity: Buffer size; if the buffering is full, the `_MemoryHandler` auto flush it.
-        :param flushInterval: Flush buffer if time.time() - .theLastFlushTime > flushInterval.
+        :param flushInterval: Flush buffer if more than `flushInterval` seconds have passed since the last flush.
         :param flushLevel: Flush buffer if the level of a logRecord greater then or equal to the argument flushLevel.
         :type flushLevel:
            `str` = {"DEBUG"|"INFO"|"WARNING"|"CRITICAL"|"ERROR"} or
@@ -165,61 +271,310 @@ class TimedRotatingMemoryLogger(TimedRotatingLogger):
 
         TimedRotatingLogger.__init__(self, name, level, suffixFmt,
             capacity=capacity,
-            flushLevel=getattr(logging, flushLevel.upper()) if isinstance(flushLevel, basestring) else flushLevel,
+            flushLevel=_level_no(flushLevel),
             flushInterval=flushInterval,
              **handlerParams
          )
 
     def flush(self):
         """Ensure all log records in buffer has been flushed."""
+        # skip the lock when there is nothing to flush; handlers which don't buffer are always flushed
+        if all(isinstance(h, _MemoryHandler) and not h.buffer for h in self.handlers):
+            return
         with self._re_lock:
             for h in self.handlers:
                 h.flush()
 
 
+class FastFormatter(logging.Formatter):
+    """A `logging.Formatter` that formats the date and time of `%(asctime)s` once per second instead of once
+    per record; records logged within the same second only get their milliseconds appended.
+
+    E.g., Use it with a handler of your own:
+    >>> handler = logging.StreamHandler()
+    >>> handler.setFormatter(logutil.FastFormatter("[%(levelname)s][%(asctime)s] - %(message)s"))
+    """
+
+    default_time_format = '%Y-%m-%d %H:%M:%S'
+    default_msec_format = '%s,%03d'
+
+    def __init__(self, fmt=None, datefmt=None, *args, **kwargs):
+        """The arguments are those of `logging.Formatter`, e.g. `style`, `validate` and `defaults` on Python 3."""
+        logging.Formatter.__init__(self, fmt, datefmt, *args, **kwargs)
+        self._lastTime = (None, None)  # (second, formatted date and time of that second)
+        # `DEFAULT_FORMAT` is built by string concatenation instead of interpolating the record's `__dict__`
+        style = args[0] if args else kwargs.get('style', '%')
+        self._isDefaultFormat = fmt == DEFAULT_FORMAT and style == '%'
+
+    def format(self, record):
+        """overwrite"""
+        if not self._isDefaultFormat:
+            return logging.Formatter.format(self, record)
+        record.message = record.getMessage()
+        record.asctime = self.formatTime(record, self.datefmt)
+        s = '[' + record.levelname + '][' + record.asctime + '] - ' + record.message
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            s = s + '\n' + record.exc_text if s[-1:] != '\n' else s + record.exc_text
+        if getattr(record, 'stack_info', None):
+            s = s + '\n' + self.formatStack(record.stack_info) if s[-1:] != '\n' else s + self.formatStack(record.stack_info)
+        return s
+
+    def formatTime(self, record, datefmt=None):
+        """overwrite"""
+        if datefmt:
+            return logging.Formatter.formatTime(self, record, datefmt)
+        second = int(record.created)
+        lastSecond, text = self._lastTime
+        if second != lastSecond:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            self._lastTime = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+def _format_records(handler, records):
+    """Return the lines `handler` formats from those of `records` which pass its filters."""
+    lines = []
+    for record in records:
+        if handler.filter(record):
+            try:
+                lines.append(handler.format(record))
+            except Exception:
+                handler.handleError(record)
+    return lines
+
+
+def _write_records(target, records):
+    """Pass `records` to the handler `target`. Records for a `_RawFDHandler` or a `logging.StreamHandler` are
+    formatted first and then written by a single write, otherwise they are handled one by one."""
+    if isinstance(target, _RawFDHandler):
+        target.write_many(records)
+        return
+    if not isinstance(target, logging.StreamHandler):
+        for record in records:
+            target.handle(record)
+        target.flush()
+        return
+
+    lines = _format_records(target, records)
+    if not lines:
+        return
+    lines.append('')
+    target.acquire()
+    try:
+        target.stream.write('\n'.join(lines))
+        target.flush()
+    except Exception:
+        target.handleError(records[-1])
+    finally:
+        target.release()
+
+
 class _MemoryHandler(MemoryHandler):
+    # seconds `close()` waits for the flusher thread, so a stuck target (e.g. a full disk) can't hang the exit
+    closeTimeout = 5.0
+    # batches of `capacity` records the buffer may hold ahead of the flusher thread; beyond it the logging
+    # thread writes the buffer itself, so a slow target applies back pressure instead of growing the buffer
+    maxPendingFlushes = 64
+
     def __init__(self, flushInterval, **kwargs):
         MemoryHandler.__init__(self, **kwargs)
+        # producers append and the flusher pops from the other end, both atomic, so no lock guards the buffer
+        self.buffer = collections.deque()
         self.__flushInterval = flushInterval
-        self.__lastFlushTime = time.time()
-        self.__condition = threading.Condition()
-        self.__flusher = None
+        self.__flushDeadline = _now() + flushInterval  # the buffer is flushed once the clock passes it
+        self.__writeLock = threading.Lock()
+        self.__wake = threading.Event()
+        self.__closed = False
+        self.__flusher = threading.Thread(target=self.__run, name='flusher')
+        self.__flusher.daemon = True
+        self.__flusher.start()
 
     def shouldFlush(self, record):
-        return MemoryHandler.shouldFlush(self, record) or (time.time() - self.__lastFlushTime > self.__flushInterval)\
-               or (record.levelno >= self.flushLevel)
+        # cheap checks first, the clock is only read when neither level nor capacity triggers a flush
+        if record.levelno >= self.flushLevel or len(self.buffer) >= self.capacity:
+            return True
+        return _now() > self.__flushDeadline
+
+    def handle(self, record):
+        """overwrite, `emit` is called without taking the handler lock"""
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record, _len=len, _now=_now):
+        """overwrite, the conditions of `shouldFlush` are inlined to save a method call per record;
+        `_len` and `_now` are bound as locals"""
+        buffer = self.buffer
+        buffer.append(record)
+        size = _len(buffer)
+        if size >= self.capacity or record.levelno >= self.flushLevel \
+                or _now() > self.__flushDeadline:
+            if size >= self.capacity * self.maxPendingFlushes:
+                self.__write_buffered()
+            else:
+                self.flush()
 
     def flush(self):
-        with self.__condition:
-            try:
-                target, buffered, self.buffer = self.target, self.buffer, []
-                self.__flusher = threading.Thread(target=self.__flush, args=(target, buffered,), name='flusher')
-                self.__flusher.isDaemon() and self.__flusher.setDaemon(False)
-                self.__flusher.start()
-                self.__condition.wait(1.0)
-            except Exception:
-                self.buffer = buffered
-                print '[CRITICAL] [%s] Can not start a new thread' % time.strftime('%Y-%m-%dT%H:%M:%S')
-                time.sleep(0.01)
-            except KeyboardInterrupt:
-                print '[CRITICAL] [%s] Interrupt error occurred when flushing logger buffer' % time.strftime('%Y-%m-%dT%H:%M:%S')
-
-    def __flush(self, target, buffered):
-        with self.__condition:
-            self.__condition.notifyAll()
-        for record in buffered:
-            target.handle(record)
-        self.__lastFlushTime = time.time()
+        """Wake the flusher thread to write the buffered records without waiting for it.
+        Once the handler is closed, the records are written by the calling thread."""
+        if not self.buffer or self.target is None:
+            # nothing to write, which counts as a flush
+            self.__flushDeadline = _now() + self.__flushInterval
+            return
+        if self.__closed:
+            # don't wait for a flusher `close()` gave up on, it's stuck on the target
+            self.__write_buffered(blocking=False)
+        else:
+            self.__wake.set()
+
+    def __write_buffered(self, blocking=True):
+        # one writer at a time, so batches reach the target in the order they were logged
+        if not self.__writeLock.acquire(blocking):
+            return
+        try:
+            buffer, target = self.buffer, self.target
+            if target is None:
+                return
+            records = [buffer.popleft() for _ in range(len(buffer))]
+            if records:
+                _write_records(target, records)
+            self.__flushDeadline = _now() + self.__flushInterval
+        finally:
+            self.__writeLock.release()
+
+    def __run(self):
+        while not self.__closed:
+            self.__wake.wait()
+            self.__wake.clear()
+            self.__write_buffered()
 
     def close(self):
-        self.flush()
-        if self.__flusher and self.__flusher.is_alive():
-            self.__flusher.join()
+        """Stop the flusher thread once it has written the buffer, then write what's left of it and close
+        the target, which `make_handler` created for this handler only. If the flusher is still stuck on the
+        target after `closeTimeout`, both are skipped rather than waiting on it."""
+        self.acquire()
+        try:
+            if not self.__closed:
+                self.__closed = True
+                self.__wake.set()
+                self.__flusher.join(self.closeTimeout)
+                self.__write_buffered(blocking=False)
+        finally:
+            self.release()
+        target = self.target
         MemoryHandler.close(self)
-        
+        if target is not None and not self.__flusher.is_alive():
+            target.close()
+
+
+class _RawFDHandler(logging.Handler):
+    """A handler that appends records to a file with `os.write`, without Python's buffered IO layers on top
+    of the file descriptor. The file is opened with `O_APPEND`, so every write lands at its end as a whole."""
+
+    closeTimeout = 5.0
+
+    def __init__(self, filename, encoding='utf-8'):
+        logging.Handler.__init__(self)
+        self.baseFilename = os.path.abspath(filename)
+        self.encoding = encoding
+        self._fd = self._open()
+        # guards the fd instead of the handler lock, which `handle` doesn't take, so `logging.shutdown`
+        # can't hang behind a stuck write
+        self._fdLock = threading.Lock()
+
+    def _open(self):
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+        return os.open(self.baseFilename, flags, 0o644)
+
+    def handle(self, record):
+        """overwrite, `emit` is called without taking the handler lock"""
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        try:
+            text = self.format(record) + '\n'
+            self._write_locked(self._write, text)
+        except Exception:
+            self.handleError(record)
+
+    def write_many(self, records):
+        """Format `records` and write them to the file with a single `os.writev`, the formatted lines are
+        passed as they are instead of being joined into one string first."""
+        chunks = [self._encode(line + '\n') for line in _format_records(self, records)]
+        if not chunks:
+            return
+        try:
+            if _writev is None:
+                self._write_locked(self._write, b''.join(chunks))
+            else:
+                self._write_locked(self._write_chunks, chunks)
+        except Exception:
+            self.handleError(records[-1])
+
+    def _write_locked(self, write, data):
+        with self._fdLock:
+            # a thread may still log to a handler that was just closed, e.g. by a rotation; like
+            # `logging.FileHandler` the file is reopened, but only for this write so the fd isn't leaked
+            reopened = self._fd is None
+            if reopened:
+                self._fd = self._open()
+            try:
+                write(data)
+            finally:
+                if reopened:
+                    os.close(self._fd)
+                    self._fd = None
+
+    def _encode(self, text):
+        return text if isinstance(text, bytes) else text.encode(self.encoding)
+
+    def _write(self, text):
+        data = self._encode(text)
+        while data:
+            data = data[os.write(self._fd, data):]
+
+    def _write_chunks(self, chunks):
+        while chunks:
+            written = _writev(self._fd, chunks[:_IOV_MAX])
+            # drop the chunks written completely, a partially written one keeps its tail
+            i = 0
+            while i < len(chunks) and written >= len(chunks[i]):
+                written -= len(chunks[i])
+                i += 1
+            chunks = chunks[i:]
+            if written:
+                chunks[0] = chunks[0][written:]
+
+    def close(self):
+        # a write stuck for longer than `closeTimeout` keeps the fd, it's left open rather than waited for
+        deadline = _now() + self.closeTimeout
+        while not self._fdLock.acquire(False):
+            if _now() >= deadline:
+                logging.Handler.close(self)
+                return
+            time.sleep(0.01)
+        try:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        finally:
+            self._fdLock.release()
+        logging.Handler.close(self)
+
+    def __repr__(self):
+        return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, logging.getLevelName(self.level))
+
 
-import functools
-import traceback 
 import sys
 
 from .trace import Trace
@@ -239,20 +594,43 @@ class LogException(Exception):
     
 def handle_exception(logger, throws=False):
     def function_wrapper(func):
-        @functools.wraps(func)
-        def function_invoker(*args, **kwagrs):
-            try:
-                return func(*args, **kwagrs)
-            except (SystemExit, KeyboardInterrupt):
-                raise
-            except LogException as (log_level, errno_or_msg):
-                message = errno_message_map.get(errno_or_msg) or errno_or_msg
-                getattr(logger, log_level.lower())(message)
-                if throws:
+        log_methods = dict((name, getattr(logger, name.lower())) for name in _LEVEL_MAP)
+        log_error, is_enabled, get_message = log_methods['error'], logger.isEnabledFor, errno_message_map.get
+
+        def log_exception(e):
+            log_level, errno_or_msg = e.args
+            if is_enabled(_level_no(log_level)):
+                (log_methods.get(log_level) or getattr(logger, log_level.lower()))(get_message(errno_or_msg) or errno_or_msg)
+
+        def log_traceback():
+            # the traceback is formatted by the handler, so not at all if the record is dropped,
+            # and by the flusher thread for a `_MemoryHandler`
+            log_error('Exception in %s.%s', func.__module__, func.__name__, exc_info=True)
+
+        # `throws` is fixed per decorated function, so pick an invoker with the re-raise built in or left out
+        if throws:
+            @functools.wraps(func)
+            def function_invoker(*args, **kwagrs):
+                try:
+                    return func(*args, **kwagrs)
+                except (SystemExit, KeyboardInterrupt):
+                    raise
+                except LogException as e:
+                    log_exception(e)
+                    raise
+                except:
+                    log_traceback()
                     raise
-            except:
-                logger.error(traceback.format_exc().decode(sys.getfilesystemencoding()))
-                if throws:
+        else:
+            @functools.wraps(func)
+            def function_invoker(*args, **kwagrs):
+                try:
+                    return func(*args, **kwagrs)
+                except (SystemExit, KeyboardInterrupt):
                     raise
+                except LogException as e:
+                    log_exception(e)
+                except:
+                    log_traceback()
         return function_invoker
     return function_wrapper
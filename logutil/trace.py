@@ -1,4 +1,5 @@
 import inspect
+import sys
 
 
 def cls_name(cls):
@@ -9,15 +10,21 @@ def type_name(obj):
     return obj.__class__.__module__ + '.' + obj.__class__.__name__
 
 
+def frame_of(stack):
+    """`stack` is either a frame object or a record of `inspect.stack()`, which holds the frame first."""
+    return stack if inspect.isframe(stack) else stack[0]
+
+
 def cls_from_stact(stack):
-    locals = stack[0].f_locals
-    globals = stack[0].f_globals
-    if locals.has_key('self'):
+    frame = frame_of(stack)
+    locals = frame.f_locals
+    globals = frame.f_globals
+    if 'self' in locals:
         return locals['self'].__class__
-    elif locals.has_key('cls'):
+    elif 'cls' in locals:
         return locals['cls']
     else:
-        clss = filter(lambda x: inspect.isclass(x) and hasattr(x, stack[3]), globals.values())
+        clss = [x for x in globals.values() if inspect.isclass(x) and hasattr(x, frame.f_code.co_name)]
         assert clss, 'Class not found'
         assert len(clss) == 1, 'Multiple classes %s' % str(clss)
         return clss[0]
@@ -30,7 +37,8 @@ class Trace:
 
     @staticmethod
     def _caller_stack(pointer=2):
-        return inspect.stack()[pointer]
+        # only the frame is needed, `inspect.stack()` would also read source lines of the whole stack
+        return sys._getframe(pointer)
 
     @staticmethod
     def cls(caller_stack=None):
@@ -44,45 +52,57 @@ class Trace:
     @staticmethod
     def method(caller_stack=None):
         stack = caller_stack or Trace._caller_stack()
-        return Trace.cls(stack) + '.' + stack[3]
+        return Trace.cls(stack) + '.' + frame_of(stack).f_code.co_name
 
     @staticmethod
     def module(caller_stack=None):
         stack = caller_stack or Trace._caller_stack()
-        return stack[0].f_globals['__name__']
+        return frame_of(stack).f_globals['__name__']
 
     @staticmethod
     def func(caller_stack=None):
-        stack = caller_stack or Trace._caller_stack()
-        if stack[3] == '<module>':
+        frame = frame_of(caller_stack or Trace._caller_stack())
+        if frame.f_code.co_name == '<module>':
             return AssertionError('No function object')
-        return stack[0].f_globals.get('__name__') + '.' + stack[3]
+        return frame.f_globals.get('__name__') + '.' + frame.f_code.co_name
 
     @staticmethod
     def file(caller_stack=None):
         stack = caller_stack or Trace._caller_stack()
-        return stack[0].f_code.co_filename
+        return frame_of(stack).f_code.co_filename
 
     @staticmethod
     def line(caller_stack=None):
         stack = caller_stack or Trace._caller_stack()
-        return "%s:%s" % (Trace.file(stack), stack[0].f_lineno)
+        return "%s:%s" % (Trace.file(stack), frame_of(stack).f_lineno)
 
 
 class Traceable(object):
     __clsname = 'Traceable'
 	
+    # `this()` and `base()` depend on the class only, their results are kept in the class' own `__dict__`
     def this(self):
-        return type_name(self)
+        cls = self.__class__
+        name = cls.__dict__.get('_traceable_this')
+        if name is None:
+            name = cls._traceable_this = type_name(self)
+        return name
 
     @classmethod
     def base(cls, level=0):
-        cls = cls.__base__ if (level == 0) else cls
-        if cls.__base__ == object:
+        if level == 0 and '_traceable_base' in cls.__dict__:
+            return cls._traceable_base
+
+        klass = cls.__base__ if (level == 0) else cls
+        if klass.__base__ == object:
             raise AssertionError("There are no any classes has the attribute: '__clsname'")
 
-        attr_name = '_' + cls.__name__ + '__clsname'
-        if hasattr(cls, attr_name):
-            return cls.__module__ + '.' + getattr(cls, attr_name)
-        return cls.__base__.base(level + 1)
+        attr_name = '_' + klass.__name__ + '__clsname'
+        if hasattr(klass, attr_name):
+            name = klass.__module__ + '.' + getattr(klass, attr_name)
+        else:
+            name = klass.__base__.base(level + 1)
+        if level == 0:
+            cls._traceable_base = name
+        return name
     